@@ -7,9 +7,49 @@ PyInstaller를 사용하여 독립 실행형 애플리케이션을 빌드합니
 import os
 import sys
 import shutil
+import argparse
+import hashlib
 import subprocess
 from datetime import datetime
 
+# 빌드 결과에 영향을 주는 입력 파일 (내용 해시로 변경 여부 판단)
+SOURCE_FILES = ['student_database.py', 'database_manager.py', 'config_manager.py', 'config.json',
+                'icon.ico', 'requirements.txt', 'build.py']
+HASH_FILE = os.path.join('build', '.src_hash')
+EXE_FILE = 'dist/StudentManagement.exe'
+
+def pyinstaller_version():
+    """설치된 PyInstaller 버전 (실행할 수 없으면 빈 문자열)"""
+    try:
+        result = subprocess.run(['pyinstaller', '--version'], capture_output=True, text=True)
+    except OSError:
+        return ''
+    return result.stdout.strip()
+
+def source_hash():
+    """빌드 입력 파일들과 PyInstaller 버전의 SHA-256 해시 계산"""
+    h = hashlib.sha256()
+    h.update(pyinstaller_version().encode('utf-8'))
+    for path in SOURCE_FILES:
+        if os.path.exists(path):
+            h.update(path.encode('utf-8'))
+            with open(path, 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+def is_build_up_to_date(digest):
+    """이전 빌드 이후 입력 파일이 바뀌지 않았고 실행 파일이 남아 있는지 확인"""
+    if not os.path.exists(HASH_FILE) or not os.path.exists(EXE_FILE):
+        return False
+    with open(HASH_FILE, 'r', encoding='utf-8') as f:
+        return f.read().strip() == digest
+
+def save_source_hash(digest):
+    """성공한 빌드의 입력 해시 저장"""
+    os.makedirs(os.path.dirname(HASH_FILE), exist_ok=True)
+    with open(HASH_FILE, 'w', encoding='utf-8') as f:
+        f.write(digest)
+
 def clean_build_dirs():
     """빌드 디렉토리 정리"""
     dirs_to_clean = ['build', 'dist', '__pycache__']
@@ -24,7 +64,13 @@ def clean_build_dirs():
         print(f"🧹 {spec_file} 파일 삭제 중...")
         os.remove(spec_file)
 
-def build_application():
+def clean_dist_dir():
+    """이전 빌드 결과(dist)만 정리 - build/ 분석 캐시는 재사용"""
+    if os.path.exists('dist'):
+        print("🧹 dist 디렉토리 정리 중...")
+        shutil.rmtree('dist')
+
+def build_application(fresh=False):
     """애플리케이션 빌드"""
     print("🚀 Student Management 빌드 시작...")
     
@@ -38,10 +84,14 @@ def build_application():
         '--add-data=config.json;.',     # 설정 파일 포함
         '--hidden-import=PyQt5.sip',    # PyQt5 숨겨진 임포트
         '--hidden-import=sqlite3',      # SQLite 숨겨진 임포트
-        '--clean',                      # 빌드 캐시 정리
+        '--noconfirm',                  # 출력 디렉토리 덮어쓰기 확인 생략
         'student_database.py'           # 메인 파일
     ]
     
+    # 전체 재빌드 시에만 PyInstaller 캐시 정리
+    if fresh:
+        cmd.insert(-1, '--clean')
+    
     # 아이콘이 없으면 제거
     if not os.path.exists('icon.ico'):
         cmd.remove('--icon=icon.ico')
@@ -75,10 +125,12 @@ def create_distribution():
     
     os.makedirs(dist_folder)
     
-    # 실행 파일 복사
-    exe_file = 'dist/StudentManagement.exe'
+    # 실행 파일 복사 (내용은 copyfile로 복사해 OS 제공 고속 복사 경로 사용, 메타데이터는 별도 복사)
+    exe_file = EXE_FILE
     if os.path.exists(exe_file):
-        shutil.copy2(exe_file, dist_folder)
+        exe_target = os.path.join(dist_folder, os.path.basename(exe_file))
+        shutil.copyfile(exe_file, exe_target)
+        shutil.copystat(exe_file, exe_target)
         print(f"✅ 실행 파일 복사: {exe_file}")
     else:
         print(f"❌ 실행 파일을 찾을 수 없습니다: {exe_file}")
@@ -102,21 +154,35 @@ def create_distribution():
     print(f"🎉 배포 패키지 생성 완료: {dist_folder}")
     return dist_folder
 
-def main():
+def main(argv=None):
     """메인 빌드 프로세스"""
+    parser = argparse.ArgumentParser(description="Student Management 빌드 도구")
+    parser.add_argument('--fresh', action='store_true',
+                        help="빌드 캐시를 모두 지우고 처음부터 빌드 (릴리스용)")
+    args = parser.parse_args(argv)
+    
     print("=" * 50)
     print("🎓 Student Management 빌드 도구")
     print("=" * 50)
     
-    # 1. 빌드 디렉토리 정리
-    print("\n1️⃣ 빌드 디렉토리 정리...")
-    clean_build_dirs()
-    
-    # 2. 애플리케이션 빌드
-    print("\n2️⃣ 애플리케이션 빌드...")
-    if not build_application():
-        print("❌ 빌드가 실패했습니다.")
-        return False
+    digest = source_hash()
+    if not args.fresh and is_build_up_to_date(digest):
+        # 입력이 그대로면 정리/빌드 없이 기존 실행 파일 재사용
+        print("\n1️⃣ 2️⃣ 변경된 소스가 없어 기존 빌드 결과를 재사용합니다.")
+    else:
+        # 1. 빌드 디렉토리 정리
+        print("\n1️⃣ 빌드 디렉토리 정리...")
+        if args.fresh:
+            clean_build_dirs()
+        else:
+            clean_dist_dir()
+        
+        # 2. 애플리케이션 빌드
+        print("\n2️⃣ 애플리케이션 빌드...")
+        if not build_application(fresh=args.fresh):
+            print("❌ 빌드가 실패했습니다.")
+            return False
+        save_source_hash(digest)
     
     # 3. 배포 패키지 생성
     print("\n3️⃣ 배포 패키지 생성...")
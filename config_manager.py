@@ -1,10 +1,29 @@
-import json
 import os
-from typing import Dict, Any
+import json
+from typing import Dict, Any, Tuple
+
+def _json_dumps(obj: Any) -> bytes:
+    # orjson의 OPT_INDENT_2와 같은 형식 (2칸 들여쓰기, 한글 그대로 저장)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# orjson이 설치되어 있으면 사용 (C 구현으로 더 빠름), 없으면 표준 json 사용
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = _json_dumps
+    _loads = json.loads
 
 class ConfigManager:
     """설정 파일 관리 클래스"""
     
+    # 설정 파일 경로별 (수정 시각, 설정) 캐시 - 인스턴스 간 공유
+    _cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    
     def __init__(self, config_file: str = "config.json"):
         self.data_dir = self.get_student_data_dir()
         self.config_file = os.path.join(self.data_dir, config_file)
@@ -42,13 +61,20 @@ class ConfigManager:
         
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    # 기본값과 병합
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
+                # 파일이 바뀌지 않았다면 파싱 없이 캐시 사용
+                mtime = os.stat(self.config_file).st_mtime_ns
+                cached = ConfigManager._cache.get(self.config_file)
+                if cached and cached[0] == mtime:
+                    return dict(cached[1])
+                
+                with open(self.config_file, 'rb') as f:
+                    config = _loads(f.read())
+                # 기본값과 병합
+                for key, value in default_config.items():
+                    if key not in config:
+                        config[key] = value
+                ConfigManager._cache[self.config_file] = (mtime, dict(config))
+                return config
             except Exception as e:
                 print(f"설정 파일 로드 오류: {e}")
                 return default_config
@@ -63,8 +89,9 @@ class ConfigManager:
             config = self.config
         
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            with open(self.config_file, 'wb') as f:
+                f.write(_dumps(config))
+            ConfigManager._cache[self.config_file] = (os.stat(self.config_file).st_mtime_ns, dict(config))
             self.config = config
             return True
         except Exception as e:
@@ -0,0 +1,278 @@
+import sqlite3
+from datetime import date
+import csv
+import re
+from pathlib import Path
+
+# 상수 정의
+
+CSV_HEADER = ["년도", "학번", "이름", "등록일", "최근평가일", "과목", "점수", "평가일", "비고"]
+CSV_CHUNK_ROWS = 5000  # CSV 작업 진행 상황을 알리는 행 단위
+
+# 학번 앞 4자리(년도)별 학생 수 조회
+# (idx_students_year 커버링 인덱스 순서대로 읽으므로 테이블 조회/정렬 없음)
+YEAR_COUNTS_QUERY = '''
+    SELECT SUBSTR(student_number, 1, 4) as year, COUNT(*)
+    FROM students
+    WHERE LENGTH(student_number) >= 4
+    GROUP BY year
+    ORDER BY year
+'''
+
+# 검증용 정규식 (모듈 로드 시 한 번만 컴파일)
+_STUDENT_NUMBER_RE = re.compile(r'\d{4,10}')
+_NAME_RE = re.compile(r'[가-힣a-zA-Z0-9\s]{1,20}')
+
+# 데이터 검증 함수들
+def is_valid_date(date_str):
+    # 정규식 없이 길이/구분자/ASCII 숫자만 확인 (CSV 불러오기에서 행마다 호출됨)
+    if not date_str or len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        return False
+    year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+    if not date_str.isascii() or not (year + month + day).isdigit():
+        return False
+    # strptime 대신 date 생성으로 실제 존재하는 날짜인지 확인
+    try:
+        date(int(year), int(month), int(day))
+        return True
+    except ValueError:
+        return False
+
+def is_valid_student_number(student_number):
+    """학번 형식 검증 (숫자만 허용, 4-10자리)"""
+    if not student_number:
+        return False
+    return bool(_STUDENT_NUMBER_RE.fullmatch(student_number))
+
+def is_valid_score(score_str):
+    """점수 검증 (0-100 범위, 정규식 없이 float 변환과 범위 비교만 사용)"""
+    try:
+        score = float(score_str)
+        return 0 <= score <= 100  # NaN은 비교 결과가 False이므로 걸러짐
+    except (ValueError, TypeError):
+        return False
+
+def is_valid_name(name):
+    """이름 검증 (1-20자, 한글/영문/숫자 허용)"""
+    if not name:
+        return False
+    return bool(_NAME_RE.fullmatch(name))
+
+# 평가 추가/삭제 시 해당 학생의 최근 수정일을 갱신하는 트리거 (이벤트, 참조 행)
+EVAL_TOUCH_TRIGGERS = (('INSERT', 'NEW'), ('DELETE', 'OLD'))
+
+def create_eval_triggers(cursor):
+    """평가 변경 시 학생 최근 수정일 자동 갱신 트리거 생성"""
+    for event, ref in EVAL_TOUCH_TRIGGERS:
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_eval_{event.lower()}_touch
+            AFTER {event} ON evaluations
+            BEGIN
+                UPDATE students SET last_modified = datetime('now', 'localtime')
+                WHERE id = {ref}.student_id;
+            END
+        ''')
+
+def drop_eval_triggers(cursor):
+    """대량 교체 작업 동안 트리거 제거 (같은 트랜잭션 안에서 다시 생성)"""
+    for event, _ in EVAL_TOUCH_TRIGGERS:
+        cursor.execute(f'DROP TRIGGER IF EXISTS trg_eval_{event.lower()}_touch')
+
+def create_eval_index(cursor):
+    """학생별 평가 조회/정렬용 인덱스 생성 (student_number는 UNIQUE 제약으로 이미 인덱스 존재)"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_evals_student
+        ON evaluations (student_id, evaluation_date DESC)
+    ''')
+
+def create_schema(cursor):
+    """테이블, 인덱스, 트리거 생성 (이미 있으면 그대로 둠)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_number TEXT UNIQUE,
+            name TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS evaluations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER,
+            subject TEXT NOT NULL,
+            score REAL,
+            evaluation_date DATE,
+            notes TEXT,
+            FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE
+        )
+    ''')
+    create_eval_index(cursor)
+    # 년도 콤보박스 조회용 식 인덱스 (load_year_combo와 같은 식/조건이어야 사용됨)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_students_year
+        ON students (SUBSTR(student_number, 1, 4), student_number)
+        WHERE LENGTH(student_number) >= 4
+    ''')
+    create_eval_triggers(cursor)
+
+def open_database(db_path, read_only=False):
+    """데이터베이스 연결 및 성능 관련 PRAGMA 설정 (스레드마다 별도 연결 사용)
+
+    read_only=True이면 읽기 전용으로 연결해 쓰기 잠금을 잡지 않는다 (WAL이므로
+    다른 연결의 쓰기와 동시에 읽을 수 있음).
+    """
+    # 문장 캐시를 넉넉히 두어 자주 쓰는 SQL을 매번 다시 컴파일하지 않도록 함
+    if read_only:
+        uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, cached_statements=256)
+    else:
+        conn = sqlite3.connect(db_path, cached_statements=256)
+    # WAL 저널 + NORMAL 동기화로 커밋마다 발생하는 fsync를 줄임
+    # mmap_size: 최대 256MB까지 파일을 메모리 매핑해 읽기 시 복사를 줄임
+    conn.executescript('''
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -20000;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA foreign_keys = ON;
+    ''')
+    return conn
+
+def export_csv_file(conn, file_path, progress=None):
+    """학생 정보와 평가 정보를 통합 CSV로 저장 (progress에는 지금까지 기록한 행 수 전달)"""
+    cursor = conn.execute('''
+        SELECT 
+            SUBSTR(s.student_number, 1, 4) as year,
+            s.student_number, 
+            s.name, 
+            s.created_at, 
+            s.last_modified,
+            e.subject, 
+            e.score, 
+            e.evaluation_date, 
+            e.notes 
+        FROM students s 
+        LEFT JOIN evaluations e ON s.id = e.student_id 
+        ORDER BY s.student_number, e.evaluation_date DESC
+    ''')
+    
+    with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        # 전체 결과를 메모리에 올리지 않고 CSV_CHUNK_ROWS 행씩 가져와 기록
+        written = 0
+        for rows in iter(lambda: cursor.fetchmany(CSV_CHUNK_ROWS), []):
+            writer.writerows(rows)
+            written += len(rows)
+            if progress:
+                progress(written)
+
+def import_csv_file(conn, file_path, progress=None):
+    """통합 CSV로 학생 정보와 평가 정보를 전부 교체 (컬럼이 다르면 ValueError)
+
+    progress에는 지금까지 읽은 행 수를 CSV_CHUNK_ROWS 행마다 전달한다.
+    """
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        
+        # 컬럼 검증 (헤더만 읽은 상태에서 확인)
+        if header != CSV_HEADER:
+            raise ValueError(f"CSV의 컬럼이 올바르지 않습니다.\n필요: {CSV_HEADER}\n입력: {header}")
+        
+        # 헤더가 CSV_HEADER와 같으므로 컬럼 위치는 한 번만 계산
+        num_i, name_i, created_i, modified_i, subject_i, score_i, date_i, notes_i = (
+            CSV_HEADER.index(col) for col in ("학번", "이름", "등록일", "최근평가일", "과목", "점수", "평가일", "비고"))
+        width = len(CSV_HEADER)
+        
+        def csv_rows():
+            """CSV를 한 행씩 읽으며 검증된 행을 내보냄 (평가 정보가 없거나 잘못되면 평가 칸은 NULL)"""
+            for count, row in enumerate(reader, 1):
+                if progress and count % CSV_CHUNK_ROWS == 0:
+                    progress(count)
+                if not row:
+                    continue  # 빈 줄 건너뜀
+                if len(row) < width:
+                    row += [None] * (width - len(row))
+                subject = score = eval_date = notes = None
+                # 평가 정보가 있다면 점수 float 변환, 날짜 검증
+                if row[subject_i] and row[score_i] and row[date_i] and is_valid_date(row[date_i]):
+                    try:
+                        score = float(row[score_i])
+                        subject, eval_date, notes = row[subject_i], row[date_i], row[notes_i]
+                    except ValueError:
+                        pass
+                yield (row[num_i], row[name_i], row[created_i], row[modified_i], subject, score, eval_date, notes)
+        
+        cursor = conn.cursor()
+        # 임시 테이블은 CSV 전체 크기만큼 커지므로 메모리 대신 임시 파일에 두어
+        # 메모리 사용량이 파일 크기에 비례해 늘지 않도록 함 (작업 후 원래 설정 복원)
+        temp_store = cursor.execute('PRAGMA temp_store').fetchone()[0]
+        cursor.execute('PRAGMA temp_store = FILE')
+        try:
+            # 전체 교체를 하나의 트랜잭션으로 일괄 처리
+            # (CSV의 최근평가일을 유지하도록 트리거는 잠시 제거)
+            with conn:
+                # 1) 임시 테이블에 CSV 전체를 먼저 적재 - 본 테이블은 아직 건드리지 않음
+                cursor.execute('DROP TABLE IF EXISTS temp.import_rows')
+                cursor.execute('''
+                    CREATE TEMP TABLE import_rows (
+                        student_number TEXT, name TEXT, created_at TEXT, last_modified TEXT,
+                        subject TEXT, score REAL, evaluation_date TEXT, notes TEXT
+                    )
+                ''')
+                cursor.executemany('INSERT INTO temp.import_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?)', csv_rows())
+                
+                # 2) 본 테이블 교체 - 학번별 첫 행으로 학생을 만들고, 평가는 학번 조인으로 id 연결
+                # 외래키 검사는 커밋 시점으로 미루고, 평가 인덱스는 행마다 갱신하지 않도록
+                # 지웠다가 적재 후 한 번에 다시 만듦
+                cursor.execute('PRAGMA defer_foreign_keys = ON')
+                drop_eval_triggers(cursor)
+                cursor.execute('DROP INDEX IF EXISTS idx_evals_student')
+                cursor.execute('DELETE FROM evaluations')
+                cursor.execute('DELETE FROM students')
+                cursor.execute('''
+                    INSERT INTO students (student_number, name, created_at, last_modified)
+                    SELECT student_number, name, created_at, last_modified
+                    FROM temp.import_rows
+                    WHERE rowid IN (SELECT MIN(rowid) FROM temp.import_rows GROUP BY student_number)
+                    ORDER BY rowid
+                ''')
+                cursor.execute('''
+                    INSERT INTO evaluations (student_id, subject, score, evaluation_date, notes)
+                    SELECT s.id, r.subject, r.score, r.evaluation_date, r.notes
+                    FROM temp.import_rows r JOIN students s ON s.student_number = r.student_number
+                    WHERE r.score IS NOT NULL
+                    ORDER BY r.rowid
+                ''')
+                create_eval_index(cursor)
+                create_eval_triggers(cursor)
+                cursor.execute('DROP TABLE temp.import_rows')
+        finally:
+            cursor.execute(f'PRAGMA temp_store = {int(temp_store)}')
+
+def backup_database_file(conn, file_path):
+    """SQLite 온라인 백업 API로 WAL에 있는 변경분까지 일관된 스냅샷으로 복사"""
+    backup_conn = sqlite3.connect(file_path)
+    try:
+        conn.backup(backup_conn)
+    finally:
+        backup_conn.close()
+
+def restore_database_file(conn, file_path):
+    """백업 파일을 현재 연결에 그대로 덮어씀 (연결을 닫았다 다시 열 필요 없음)"""
+    conn.commit()
+    # WAL 모드에서는 페이지 크기가 다른 파일(예: 1024바이트 페이지의 이전 SQLite 백업)을
+    # 덮어쓸 수 없으므로 복원하는 동안만 DELETE 저널로 바꿨다가 WAL로 되돌림
+    conn.execute('PRAGMA journal_mode = DELETE')
+    source_conn = sqlite3.connect(file_path)
+    try:
+        source_conn.backup(conn)
+    finally:
+        source_conn.close()
+        conn.execute('PRAGMA journal_mode = WAL')
+    # 이전 버전 백업일 수 있으므로 인덱스/트리거 보완
+    create_schema(conn.cursor())
+    conn.commit()
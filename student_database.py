@@ -1,55 +1,144 @@
 import sys
 import sqlite3
-from datetime import datetime
-import csv
-import re
+from datetime import datetime, date
+from collections import Counter
+from bisect import bisect_left, bisect_right
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QTableWidget, QTableWidgetItem, QGroupBox, QHeaderView, QMessageBox,
-    QMenuBar, QMenu, QFileDialog, QComboBox
+    QPushButton, QTableView, QGroupBox, QHeaderView, QMessageBox,
+    QMenuBar, QMenu, QFileDialog, QComboBox, QProgressDialog
 )
 from PySide6.QtGui import QKeySequence, QFont, QAction
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QThread, QTimer, Signal
 from config_manager import ConfigManager
+from database_manager import (
+    YEAR_COUNTS_QUERY, is_valid_date, is_valid_student_number, is_valid_score,
+    is_valid_name, create_schema, open_database, export_csv_file,
+    import_csv_file, backup_database_file, restore_database_file
+)
+
+class ColumnView:
+    """행 목록의 한 컬럼을 복사 없이 시퀀스로 보여줌 (Python 3.7의 bisect에는 key 인자가 없음)"""
+
+    def __init__(self, rows, column):
+        self.rows = rows
+        self.column = column
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        return self.rows[i][self.column]
 
-# 상수 정의
-
-CSV_HEADER = ["년도", "학번", "이름", "등록일", "최근평가일", "과목", "점수", "평가일", "비고"]
-
-# 데이터 검증 함수들
-def is_valid_date(date_str):
-    if not date_str:
-        return False
-    pattern = r'^\d{4}-\d{2}-\d{2}$'
-    if not re.match(pattern, date_str):
-        return False
-    try:
-        datetime.strptime(date_str, '%Y-%m-%d')
-        return True
-    except ValueError:
-        return False
-
-def is_valid_student_number(student_number):
-    """학번 형식 검증 (숫자만 허용, 4-10자리)"""
-    if not student_number:
-        return False
-    pattern = r'^\d{4,10}$'
-    return bool(re.match(pattern, student_number))
-
-def is_valid_score(score_str):
-    """점수 검증 (0-100 범위)"""
-    try:
-        score = float(score_str)
-        return 0 <= score <= 100
-    except ValueError:
-        return False
-
-def is_valid_name(name):
-    """이름 검증 (1-20자, 한글/영문/숫자 허용)"""
-    if not name:
-        return False
-    pattern = r'^[가-힣a-zA-Z0-9\s]{1,20}$'
-    return bool(re.match(pattern, name))
+def sorted_position(rows, column, key, descending=False):
+    """정렬된 행 목록에서 key가 들어갈 위치 (같은 값이면 기존 행들 뒤)"""
+    if not descending:
+        return bisect_right(ColumnView(rows, column), key)
+    # 내림차순은 학생 한 명의 평가 목록(날짜순)에만 쓰이므로 짧은 목록을 순차 탐색
+    for i, existing in enumerate(rows):
+        if existing[column] < key:
+            return i
+    return len(rows)
+
+class CsvWorker(QObject):
+    """CSV 가져오기/내보내기를 UI 스레드 밖에서 실행하는 작업 객체
+
+    SQLite 연결은 스레드 간에 공유할 수 없으므로 작업 스레드에서 별도로 연결한다.
+    """
+    finished = Signal(bool, str)  # (성공 여부, 오류 메시지)
+    progress = Signal(int)  # 지금까지 처리한 행 수
+
+    def __init__(self, task, db_path, file_path, read_only=False):
+        super().__init__()
+        self.task = task
+        self.db_path = db_path
+        self.file_path = file_path
+        self.read_only = read_only
+
+    def run(self):
+        try:
+            conn = open_database(self.db_path, self.read_only)
+            try:
+                self.task(conn, self.file_path, self.progress.emit)
+            finally:
+                conn.close()
+        except Exception as e:
+            self.finished.emit(False, str(e))
+        else:
+            self.finished.emit(True, "")
+
+class RecordTableModel(QAbstractTableModel):
+    """SQLite 조회 결과(튜플 리스트)를 그대로 보여주는 읽기 전용 테이블 모델
+
+    with_row_id=True이면 각 행의 첫 값을 기본키로 보고 화면에 표시하지 않으며,
+    Qt.UserRole로 조회할 수 있게 한다.
+    """
+
+    def __init__(self, headers, parent=None, with_row_id=False):
+        super().__init__(parent)
+        self._headers = headers
+        self._offset = 1 if with_row_id else 0
+        self._rows = []
+
+    def set_rows(self, rows):
+        """전체 행 교체 (뷰는 화면에 보이는 셀만 다시 그림)"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def insert_sorted(self, values, column, descending=False):
+        """정렬 순서를 유지하며 한 행 삽입 (같은 값이면 기존 행 뒤에), 삽입 위치 반환"""
+        row = sorted_position(self._rows, column, values[column], descending)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, values)
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row):
+        """한 행만 제거"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def update_row(self, row, values):
+        """한 행의 값만 교체"""
+        self._rows[row] = values
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+
+    def find_row(self, row_id, column, key):
+        """오름차순으로 정렬된 column에서 key를 이분 탐색해 기본키가 row_id인 행 위치 반환, 없으면 -1"""
+        row = bisect_left(ColumnView(self._rows, column), key)
+        if row < len(self._rows) and self._rows[row][0] == row_id:
+            return row
+        return -1
+
+    def row_values(self, row):
+        """해당 행의 표시 값 튜플 반환 (기본키 제외)"""
+        return self._rows[row][self._offset:]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][index.column() + self._offset]
+            # TEXT 컬럼은 이미 str이므로 변환 생략, NULL은 빈 칸으로 표시
+            if isinstance(value, str):
+                return value
+            return '' if value is None else str(value)
+        if role == Qt.UserRole and self._offset:
+            return self._rows[index.row()][0]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
 
 class StudentDatabase(QWidget):
     def __init__(self):
@@ -72,55 +161,45 @@ class StudentDatabase(QWidget):
         y = screen_geometry.y() + (screen_height - win_height) // 2
         self.move(x, y)
 
-        # 폰트 크기 비율로 동적 조정 (기본 14, FHD 기준 1080px에서 14)
-        base_height = 1080
-        base_font_size = 14
-        # 폰트 크기 비율을 0.8배로 줄임
-        font_size = max(10, int(base_font_size * (win_height / base_height) * 0.8))
+        # 창 높이에 맞춘 UI 폰트 (한 번만 계산해 재사용)
+        self.app_font = self.compute_font(win_height)
         
+        self.csv_thread = None  # 실행 중인 CSV 작업 스레드 (없으면 None)
         
         # 설정에서 데이터베이스 경로 가져오기
         db_path = self.config_manager.get('database_path')
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
-        # 외래키 제약조건 활성화
-        self.cursor.execute('PRAGMA foreign_keys = ON')
+        self.connect_database(db_path)
         self.init_database()
-        self.init_ui(font_size)
+        self.init_ui(self.app_font)
+        self.reload_students()
         self.load_students()
         self.refresh_statistics()  # 초기 통계 로드
 
+    def compute_font(self, win_height):
+        """창 높이 비율로 폰트 크기 동적 조정 (기본 14, FHD 기준 1080px에서 14)"""
+        base_height = 1080
+        base_font_size = 14
+        # 폰트 크기 비율을 0.8배로 줄임
+        font = QFont()
+        font.setPointSizeF(max(10, int(base_font_size * (win_height / base_height) * 0.8)))
+        return font
+
+    def connect_database(self, db_path):
+        """데이터베이스 연결"""
+        self.db_path = db_path
+        self.conn = open_database(db_path)
+        self.cursor = self.conn.cursor()
+
     def init_database(self):
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_number TEXT UNIQUE,
-                name TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS evaluations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER,
-                subject TEXT NOT NULL,
-                score REAL,
-                evaluation_date DATE,
-                notes TEXT,
-                FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE
-            )
-        ''')
+        create_schema(self.cursor)
         self.conn.commit()
 
-    def init_ui(self, font_size):
+    def init_ui(self, menubar_font):
         main_layout = QVBoxLayout()
 
-        # 메뉴바 추가 (폰트 크기 1.0배 적용)
+        # 메뉴바 추가 (UI 폰트 그대로 적용)
         
         self.menubar = QMenuBar(self)
-        menubar_font = QFont()
-        menubar_font.setPointSizeF(font_size * 1.0)
         self.menubar.setFont(menubar_font)
         file_menu = QMenu("파일", self)
         file_menu.setFont(menubar_font)
@@ -196,7 +275,12 @@ class StudentDatabase(QWidget):
         search_layout = QHBoxLayout()
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("학생 검색 (학번, 이름)")
-        self.search_edit.textChanged.connect(self.search_students)
+        # 키 입력마다 조회하지 않고 입력이 200ms 멈춘 뒤 한 번만 검색
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(200)
+        self.search_timer.timeout.connect(self.search_students)
+        self.search_edit.textChanged.connect(self.on_search_text_changed)
         self.clear_search_btn = QPushButton("검색 초기화")
         self.clear_search_btn.clicked.connect(self.clear_search)
         search_layout.addWidget(self.search_edit)
@@ -210,14 +294,20 @@ class StudentDatabase(QWidget):
         self.stats_label = QLabel("총 학생: 0명 | 총 평가: 0개 | 평균 점수: 0.0")
         self.refresh_stats_btn = QPushButton("통계 새로고침")
         self.refresh_stats_btn.clicked.connect(self.refresh_statistics)
+        # 연속 입력 중에는 통계 표시를 150ms 단위로 모아서 한 번만 갱신
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setSingleShot(True)
+        self.stats_timer.setInterval(150)
+        self.stats_timer.timeout.connect(self.show_statistics)
         stats_layout.addWidget(self.stats_label)
         stats_layout.addWidget(self.refresh_stats_btn)
         stats_group.setLayout(stats_layout)
         main_layout.addWidget(stats_group)
 
         # 학생 목록 테이블
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["학번", "이름", "등록일", "최근평가일"])
+        self.student_model = RecordTableModel(["학번", "이름", "등록일", "최근평가일"], self, with_row_id=True)
+        self.table = QTableView()
+        self.table.setModel(self.student_model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         main_layout.addWidget(self.table)
 
@@ -226,7 +316,7 @@ class StudentDatabase(QWidget):
         eval_layout = QHBoxLayout()
         self.subject_edit = QLineEdit()
         self.score_edit = QLineEdit()
-        self.eval_date_edit = QLineEdit(datetime.now().strftime('%Y-%m-%d'))
+        self.eval_date_edit = QLineEdit(date.today().isoformat())
         # 학번 입력창의 가로폭과 동일하게 조정
         num_width = self.num_edit.sizeHint().width()
         self.subject_edit.setFixedWidth(num_width)
@@ -257,8 +347,9 @@ class StudentDatabase(QWidget):
         main_layout.addWidget(eval_group)
 
         # 평가 목록 테이블
-        self.eval_table = QTableWidget(0, 4)
-        self.eval_table.setHorizontalHeaderLabels(["과목", "점수", "평가일", "비고"])
+        self.eval_model = RecordTableModel(["과목", "점수", "평가일", "비고"], self, with_row_id=True)
+        self.eval_table = QTableView()
+        self.eval_table.setModel(self.eval_model)
         self.eval_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         main_layout.addWidget(self.eval_table)
 
@@ -268,8 +359,8 @@ class StudentDatabase(QWidget):
         self.add_btn.clicked.connect(self.add_student)
         self.update_btn.clicked.connect(self.update_student)
         self.delete_btn.clicked.connect(self.delete_student)
-        self.table.cellClicked.connect(self.on_student_select)
-        self.table.cellDoubleClicked.connect(self.on_student_double_click)
+        self.table.clicked.connect(self.on_student_select)
+        self.table.doubleClicked.connect(self.on_student_double_click)
         self.eval_add_btn.clicked.connect(self.add_evaluation)
         self.eval_delete_btn.clicked.connect(self.delete_evaluation)
         
@@ -332,105 +423,91 @@ class StudentDatabase(QWidget):
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getSaveFileName(self, "학생정보 CSV 내보내기", "students.csv", "CSV Files (*.csv)", options=options)
         if file_path:
-            try:
-                # 학생 정보와 평가 정보를 통합하여 조회
-                self.cursor.execute('''
-                    SELECT 
-                        SUBSTR(s.student_number, 1, 4) as year,
-                        s.student_number, 
-                        s.name, 
-                        s.created_at, 
-                        s.last_modified,
-                        e.subject, 
-                        e.score, 
-                        e.evaluation_date, 
-                        e.notes 
-                    FROM students s 
-                    LEFT JOIN evaluations e ON s.id = e.student_id 
-                    ORDER BY s.student_number, e.evaluation_date DESC
-                ''')
-                data = self.cursor.fetchall()
-                
-                with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(CSV_HEADER)
-                    writer.writerows(data)
-                
-                QMessageBox.information(self, "성공", f"학생정보와 평가정보가 통합 CSV로 저장되었습니다.\n\n파일: {file_path}")
-            except Exception as e:
-                self.conn.rollback()
-                QMessageBox.critical(self, "오류", f"CSV 내보내기 중 오류 발생: {str(e)}")
+            # 내보내기는 읽기만 하므로 읽기 전용 연결 사용
+            self.start_csv_worker(export_csv_file, file_path, self.on_export_finished, "CSV 내보내는 중...", read_only=True)
+
+    def on_export_finished(self, success, error):
+        self.setEnabled(True)
+        if success:
+            QMessageBox.information(self, "성공", f"학생정보와 평가정보가 통합 CSV로 저장되었습니다.\n\n파일: {self.csv_file_path}")
+        else:
+            QMessageBox.critical(self, "오류", f"CSV 내보내기 중 오류 발생: {error}")
 
     def import_csv(self):
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getOpenFileName(self, "학생정보 CSV 불러오기", "", "CSV Files (*.csv)", options=options)
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    data = list(reader)
-                
-                # 컬럼 검증
-                if reader.fieldnames != CSV_HEADER:
-                    QMessageBox.critical(self, "오류", f"CSV의 컬럼이 올바르지 않습니다.\n필요: {CSV_HEADER}\n입력: {reader.fieldnames}")
-                    return
-                
-                self.cursor.execute('DELETE FROM evaluations')
-                self.cursor.execute('DELETE FROM students')
-                
-                # 학생 정보와 평가 정보를 분리하여 처리
-                students_added = set()  # 중복 학생 방지
-                
-                for row in data:
-                    student_number = row["학번"]
-                    
-                    # 학생 정보가 아직 추가되지 않았다면 추가
-                    if student_number not in students_added:
-                        self.cursor.execute('INSERT INTO students (student_number, name, created_at, last_modified) VALUES (?, ?, ?, ?)',
-                            (student_number, row["이름"], row["등록일"], row["최근평가일"]))
-                        students_added.add(student_number)
-                    
-                    # 평가 정보가 있다면 추가
-                    if row["과목"] and row["점수"] and row["평가일"]:
-                        self.cursor.execute('SELECT id FROM students WHERE student_number=?', (student_number,))
-                        res = self.cursor.fetchone()
-                        if res:
-                            student_id = res[0]
-                            # 점수 float 변환, 날짜 검증
-                            score = None
-                            try:
-                                score = float(row["점수"]) if row["점수"] else None
-                            except ValueError:
-                                pass
-                            eval_date = row["평가일"] if is_valid_date(row["평가일"]) else None
-                            if score is not None and eval_date:
-                                self.cursor.execute('INSERT INTO evaluations (student_id, subject, score, evaluation_date, notes) VALUES (?, ?, ?, ?, ?)',
-                                    (student_id, row["과목"], score, eval_date, row["비고"]))
-                
-                self.conn.commit()
-                self.load_students()
-                self.load_year_combo()  # 년도 콤보박스 업데이트
-                self.eval_table.setRowCount(0)
-                QMessageBox.information(self, "성공", "통합 CSV에서 학생정보와 평가정보를 불러왔습니다.")
-            except Exception as e:
-                self.conn.rollback()
-                QMessageBox.critical(self, "오류", f"CSV 불러오기 중 오류 발생: {str(e)}")
+            self.start_csv_worker(import_csv_file, file_path, self.on_import_finished, "CSV 불러오는 중...")
+
+    def on_import_finished(self, success, error):
+        self.setEnabled(True)
+        if success:
+            self.reload_students()
+            self.load_students()
+            self.clear_student_selection()  # 학생 id가 새로 매겨졌으므로 선택 해제
+            self.load_year_combo()  # 년도 콤보박스 업데이트
+            self.refresh_statistics()  # 통계 업데이트
+            self.eval_model.set_rows([])
+            QMessageBox.information(self, "성공", "통합 CSV에서 학생정보와 평가정보를 불러왔습니다.")
+        else:
+            QMessageBox.critical(self, "오류", f"CSV 불러오기 중 오류 발생: {error}")
+
+    def start_csv_worker(self, task, file_path, on_finished, label, read_only=False):
+        """CSV 작업을 별도 스레드에서 실행 (완료 전까지 입력 비활성화, 진행 표시)"""
+        self.csv_file_path = file_path
+        self.csv_progress_label = label
+        # 전체 행 수를 미리 알 수 없으므로 범위 0~0의 진행 중 표시와 처리한 행 수만 보여줌
+        self.csv_progress = QProgressDialog(label, None, 0, 0, self)
+        self.csv_progress.setWindowTitle("처리 중")
+        self.csv_progress.setWindowModality(Qt.WindowModal)
+        self.csv_progress.setMinimumDuration(0)
+        self.csv_thread = QThread(self)
+        self.csv_worker = CsvWorker(task, self.db_path, file_path, read_only)
+        self.csv_worker.moveToThread(self.csv_thread)
+        self.csv_thread.started.connect(self.csv_worker.run)
+        # 완료 신호는 UI 스레드로 전달되어 처리됨 (결과 메시지 전에 진행 창부터 닫음)
+        self.csv_worker.progress.connect(self.on_csv_progress)
+        self.csv_worker.finished.connect(self.csv_progress.close)
+        self.csv_worker.finished.connect(on_finished)
+        self.csv_worker.finished.connect(self.csv_thread.quit)
+        self.csv_worker.finished.connect(self.csv_worker.deleteLater)
+        self.csv_thread.finished.connect(self.csv_thread.deleteLater)
+        self.csv_thread.finished.connect(self.on_csv_thread_finished)
+        self.setEnabled(False)
+        self.csv_progress.show()
+        self.csv_thread.start()
+
+    def on_csv_thread_finished(self):
+        """CSV 작업 스레드 종료 처리 (스레드 객체는 deleteLater로 삭제됨)"""
+        self.csv_thread = None
+
+    def closeEvent(self, event):
+        """CSV 작업 중에는 창을 닫지 않음 (실행 중인 QThread가 삭제되면 프로그램이 비정상 종료됨)"""
+        if self.csv_thread is not None:
+            QMessageBox.information(self, "알림", "CSV 작업이 끝난 뒤에 종료해주세요.")
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    def on_csv_progress(self, count):
+        """작업 스레드가 알려준 처리 행 수를 진행 창에 표시"""
+        self.csv_progress.setLabelText(f"{self.csv_progress_label} ({count:,}행)")
 
     def load_year_combo(self):
-        """데이터베이스에서 실제 사용 중인 년도들을 조회하여 콤보박스에 추가"""
+        """데이터베이스에서 실제 사용 중인 년도들을 조회하여 콤보박스에 추가
+
+        시작/CSV 불러오기/복원 때만 전체 조회하고, 학생 추가/수정/삭제는
+        adjust_year_count로 년도별 학생 수만 갱신한다.
+        """
         self.year_combo.clear()
         
-        # 데이터베이스에서 학번의 앞 4자리(년도)를 추출하여 중복 제거 후 정렬
-        self.cursor.execute('''
-            SELECT DISTINCT SUBSTR(student_number, 1, 4) as year 
-            FROM students 
-            WHERE LENGTH(student_number) >= 4 
-            ORDER BY year
-        ''')
-        years = [row[0] for row in self.cursor.fetchall()]
+        # 데이터베이스에서 학번의 앞 4자리(년도)별 학생 수를 정렬된 순서로 조회
+        self.cursor.execute(YEAR_COUNTS_QUERY)
+        self.year_counts = Counter(dict(self.cursor.fetchall()))
+        years = list(self.year_counts)
         
         # 현재 년도가 없으면 추가
-        current_year = str(datetime.now().year)
+        current_year = str(date.today().year)
         if current_year not in years:
             years.append(current_year)
             years.sort()
@@ -442,26 +519,55 @@ class StudentDatabase(QWidget):
         # 현재 년도를 기본값으로 설정
         self.year_combo.setCurrentText(current_year)
 
+    def adjust_year_count(self, student_number, delta):
+        """학생 추가(+1)/삭제(-1)에 맞춰 년도 콤보박스를 재조회 없이 갱신"""
+        if len(student_number) < 4:
+            return
+        year = student_number[:4]
+        self.year_counts[year] += delta
+        if self.year_counts[year] > 0:
+            if self.year_combo.findText(year) < 0:
+                # 정렬 순서를 유지하는 위치에 삽입
+                row = 0
+                while row < self.year_combo.count() and self.year_combo.itemText(row) < year:
+                    row += 1
+                self.year_combo.insertItem(row, year)
+        else:
+            del self.year_counts[year]
+            # 현재 년도는 학생이 없어도 항상 표시
+            if year != str(date.today().year):
+                self.year_combo.removeItem(self.year_combo.findText(year))
+
+    def reload_students(self):
+        """전체 학생 목록을 DB에서 다시 읽어 메모리에 캐시 (시작/불러오기/복원/수정 후)"""
+        self.cursor.execute('SELECT id, student_number, name, created_at, last_modified FROM students ORDER BY student_number')
+        self.all_students = self.cursor.fetchall()
+        # 학번 앞부분 검색을 이분 탐색으로 하기 위한 정렬된 학번 목록 (all_students와 같은 순서)
+        self.student_numbers = [row[1] for row in self.all_students]
+
     def load_students(self, search_keyword=""):
-        self.table.setRowCount(0)
-        
-        if search_keyword.strip():
-            # 검색 조건이 있는 경우
-            self.cursor.execute('''
-                SELECT student_number, name, created_at, last_modified 
-                FROM students 
-                WHERE student_number LIKE ? OR name LIKE ?
-                ORDER BY student_number
-            ''', (f'%{search_keyword}%', f'%{search_keyword}%'))
+        """캐시된 전체 목록을 검색어로 걸러 표시 (검색 중에는 DB 조회 없음)"""
+        keyword = search_keyword.strip()
+        if keyword.isdigit():
+            # 숫자만 입력하면 학번 부분 일치 (기존 LIKE와 같음, 예: "0001"로 20260001 검색)
+            # 행 튜플 대신 학번 문자열 목록만 훑음
+            rows = [row for row, number in zip(self.all_students, self.student_numbers)
+                    if number and keyword in number]
+        elif keyword:
+            # 그 외에는 이름 부분 일치 (기존 LIKE와 같이 영문은 대소문자 무시)
+            lowered = keyword.lower()
+            rows = [row for row in self.all_students if lowered in row[2].lower()]
         else:
-            # 검색 조건이 없는 경우
-            self.cursor.execute('SELECT student_number, name, created_at, last_modified FROM students ORDER BY student_number')
-        
-        for row in self.cursor.fetchall():
-            row_pos = self.table.rowCount()
-            self.table.insertRow(row_pos)
-            for col, val in enumerate(row):
-                self.table.setItem(row_pos, col, QTableWidgetItem(str(val)))
+            rows = list(self.all_students)
+        self.student_model.set_rows(rows)
+
+    def on_search_text_changed(self, text):
+        """검색어 변경 처리 (검색어를 지우면 디바운스 없이 바로 전체 목록 표시)"""
+        if text.strip():
+            self.search_timer.start()
+        else:
+            self.search_timer.stop()
+            self.search_students()
 
     def search_students(self):
         """실시간 검색 기능"""
@@ -473,9 +579,9 @@ class StudentDatabase(QWidget):
         self.search_edit.clear()
         self.load_students()
 
-    def on_student_double_click(self, row, col):
+    def on_student_double_click(self, index):
         """학생 더블클릭 시 수정 모드로 전환"""
-        self.on_student_select(row, col)
+        self.on_student_select(index)
         # 수정 버튼 클릭 효과
         self.update_btn.setFocus()
         QMessageBox.information(self, "수정 모드", "학생 정보를 수정하고 '수정' 버튼을 클릭하세요.")
@@ -491,8 +597,7 @@ class StudentDatabase(QWidget):
         )
         if file_path:
             try:
-                import shutil
-                shutil.copy2('student.db', file_path)
+                backup_database_file(self.conn, file_path)
                 QMessageBox.information(self, "성공", f"데이터베이스가 백업되었습니다.\n\n파일: {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"백업 중 오류 발생: {str(e)}")
@@ -512,15 +617,12 @@ class StudentDatabase(QWidget):
                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No
                 )
                 if reply == QMessageBox.Yes:
-                    import shutil
-                    shutil.copy2(file_path, 'student.db')
-                    # 데이터베이스 연결 재설정
-                    self.conn.close()
-                    self.conn = sqlite3.connect('student.db')
-                    self.cursor = self.conn.cursor()
-                    self.cursor.execute('PRAGMA foreign_keys = ON')
+                    restore_database_file(self.conn, file_path)
                     # UI 새로고침
+                    self.reload_students()
                     self.load_students()
+                    self.clear_student_selection()
+                    self.eval_model.set_rows([])
                     self.load_year_combo()
                     self.refresh_statistics()
                     QMessageBox.information(self, "성공", "데이터베이스가 복원되었습니다.")
@@ -528,27 +630,44 @@ class StudentDatabase(QWidget):
                 QMessageBox.critical(self, "오류", f"복원 중 오류 발생: {str(e)}")
 
     def refresh_statistics(self):
-        """통계 정보 새로고침"""
+        """통계 정보 새로고침 (학생 수와 학생별 평가 집계를 DB에서 다시 읽음)
+
+        시작/CSV 불러오기/복원/수동 새로고침 때만 실행하고, 이후 추가/삭제는
+        student_count와 adjust_eval_stats로 집계만 갱신한다.
+        """
         try:
-            # 총 학생 수
             self.cursor.execute('SELECT COUNT(*) FROM students')
-            total_students = self.cursor.fetchone()[0]
-            
-            # 총 평가 수
-            self.cursor.execute('SELECT COUNT(*) FROM evaluations')
-            total_evaluations = self.cursor.fetchone()[0]
-            
-            # 평균 점수
-            self.cursor.execute('SELECT AVG(score) FROM evaluations WHERE score IS NOT NULL')
-            avg_score_result = self.cursor.fetchone()[0]
-            avg_score = avg_score_result if avg_score_result else 0.0
-            
-            # 통계 업데이트
-            stats_text = f"총 학생: {total_students}명 | 총 평가: {total_evaluations}개 | 평균 점수: {avg_score:.1f}"
-            self.stats_label.setText(stats_text)
+            self.student_count = self.cursor.fetchone()[0]
+            # 학생별 [평가 수, 점수 있는 평가 수, 점수 합계] (COUNT/TOTAL은 NULL 점수를 제외)
+            self.cursor.execute('SELECT student_id, COUNT(*), COUNT(score), TOTAL(score) FROM evaluations GROUP BY student_id')
+            self.eval_stats_by_student = {row[0]: list(row[1:]) for row in self.cursor.fetchall()}
+            self.eval_stats_total = [sum(stats[i] for stats in self.eval_stats_by_student.values()) for i in range(3)]
+            self.show_statistics()
         except Exception as e:
             self.stats_label.setText("통계 로드 중 오류 발생")
 
+    def adjust_eval_stats(self, student_id, delta, score):
+        """평가 추가(+1)/삭제(-1)를 학생별/전체 집계에 반영"""
+        for stats in (self.eval_stats_by_student.setdefault(student_id, [0, 0, 0.0]), self.eval_stats_total):
+            stats[0] += delta
+            if score is not None:
+                stats[1] += delta
+                stats[2] += delta * score
+
+    def remove_student_stats(self, student_id):
+        """삭제된 학생의 평가(CASCADE로 함께 삭제됨)를 전체 집계에서 제외"""
+        removed = self.eval_stats_by_student.pop(student_id, None)
+        if removed:
+            for i, value in enumerate(removed):
+                self.eval_stats_total[i] -= value
+
+    def show_statistics(self):
+        """현재 집계로 통계 표시 (DB 조회 없음)"""
+        total_evaluations, scored, score_sum = self.eval_stats_total
+        avg_score = score_sum / scored if scored else 0.0
+        stats_text = f"총 학생: {self.student_count}명 | 총 평가: {total_evaluations}개 | 평균 점수: {avg_score:.1f}"
+        self.stats_label.setText(stats_text)
+
     def show_settings(self):
         """설정 창 표시"""
         from PySide6.QtWidgets import QDialog, QFormLayout, QCheckBox, QSpinBox, QComboBox, QLineEdit, QDialogButtonBox
@@ -641,8 +760,11 @@ class StudentDatabase(QWidget):
             else:
                 QMessageBox.warning(self, "오류", "설정 저장에 실패했습니다.")
 
-    def on_student_select(self, row, col):
-        self.selected_student_number = self.table.item(row, 0).text()
+    def on_student_select(self, index):
+        student_number, name = self.student_model.row_values(index.row())[:2]
+        self.selected_student_number = student_number
+        # 평가 조회/추가/삭제에 쓰도록 학생 id를 선택 시점에 한 번만 저장
+        self.selected_student_id = index.data(Qt.UserRole)
         
         # 학번에서 년도와 번호 분리
         if len(self.selected_student_number) >= 4:
@@ -659,7 +781,7 @@ class StudentDatabase(QWidget):
         else:
             self.num_edit.setText(self.selected_student_number)
             
-        self.name_edit.setText(self.table.item(row, 1).text())
+        self.name_edit.setText(name)
         self.load_evaluations()
 
     def add_student(self):
@@ -684,15 +806,22 @@ class StudentDatabase(QWidget):
         full_student_number = year + num
         
         try:
-            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            self.cursor.execute('INSERT INTO students (student_number, name, created_at, last_modified) VALUES (?, ?, ?, ?)', (full_student_number, name, now, now))
+            # 등록일/수정일은 SQLite가 현지 시각으로 기록
+            self.cursor.execute("INSERT INTO students (student_number, name, created_at, last_modified) VALUES (?, ?, datetime('now', 'localtime'), datetime('now', 'localtime'))", (full_student_number, name))
+            student_id = self.cursor.lastrowid
             self.conn.commit()
-            self.load_students()
-            self.load_year_combo()  # 년도 콤보박스 업데이트
-            self.refresh_statistics()  # 통계 업데이트
+            self.search_edit.clear()  # 검색 초기화 (검색 중이었다면 캐시된 전체 목록을 다시 표시)
+            # 전체 재조회 대신 추가된 한 행만 캐시와 모델에 삽입
+            student_row = self.fetch_student_row(student_id)
+            position = bisect_right(self.student_numbers, full_student_number)
+            self.all_students.insert(position, student_row)
+            self.student_numbers.insert(position, full_student_number)
+            self.student_model.insert_sorted(student_row, 1)
+            self.adjust_year_count(full_student_number, 1)  # 년도 콤보박스 업데이트
+            self.student_count += 1
+            self.stats_timer.start()  # 통계 업데이트 예약
             self.num_edit.clear()
             self.name_edit.clear()
-            self.search_edit.clear()  # 검색 초기화
         except sqlite3.IntegrityError:
             QMessageBox.warning(self, "오류", "이미 존재하는 학번입니다.")
         except Exception as e:
@@ -713,12 +842,16 @@ class StudentDatabase(QWidget):
         # 년도와 학번을 결합하여 완전한 학번 생성
         full_student_number = year + num
         
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         try:
-            self.cursor.execute('UPDATE students SET student_number=?, name=?, last_modified=? WHERE student_number=?', (full_student_number, name, now, self.selected_student_number))
+            self.cursor.execute("UPDATE students SET student_number=?, name=?, last_modified=datetime('now', 'localtime') WHERE student_number=?", (full_student_number, name, self.selected_student_number))
             self.conn.commit()
+            self.reload_students()
             self.load_students()
-            self.load_year_combo()  # 년도 콤보박스 업데이트
+            if full_student_number[:4] != self.selected_student_number[:4]:
+                # 년도 콤보박스 업데이트
+                self.adjust_year_count(self.selected_student_number, -1)
+                self.adjust_year_count(full_student_number, 1)
+            self.selected_student_number = full_student_number
             self.search_edit.clear()  # 검색 초기화
         except sqlite3.IntegrityError:
             QMessageBox.warning(self, "오류", "이미 존재하는 학번입니다.")
@@ -733,32 +866,52 @@ class StudentDatabase(QWidget):
         try:
             self.cursor.execute('DELETE FROM students WHERE student_number=?', (self.selected_student_number,))
             self.conn.commit()
-            self.load_students()
-            self.load_year_combo()  # 년도 콤보박스 업데이트
-            self.refresh_statistics()  # 통계 업데이트
+            # 전체 재조회 대신 삭제된 한 행만 캐시와 모델에서 제거
+            student_id = self.selected_student_id
+            position = bisect_left(self.student_numbers, self.selected_student_number)
+            if position < len(self.student_numbers) and self.student_numbers[position] == self.selected_student_number:
+                del self.all_students[position]
+                del self.student_numbers[position]
+            row = self.student_model.find_row(student_id, 1, self.selected_student_number)
+            if row >= 0:
+                self.student_model.remove_row(row)
+            self.remove_student_stats(student_id)
+            self.adjust_year_count(self.selected_student_number, -1)  # 년도 콤보박스 업데이트
+            self.student_count -= 1
+            self.stats_timer.start()  # 통계 업데이트 예약
             self.search_edit.clear()  # 검색 초기화
-            self.eval_table.setRowCount(0)
+            self.eval_model.set_rows([])
             self.num_edit.clear()
             self.name_edit.clear()
-            if hasattr(self, 'selected_student_number'):
-                del self.selected_student_number
+            self.clear_student_selection()
         except Exception as e:
             self.conn.rollback()
             QMessageBox.critical(self, "오류", f"학생 삭제 중 오류: {str(e)}")
 
+    def fetch_student_row(self, student_id):
+        """학생 목록 모델과 같은 형태로 한 학생의 행 조회"""
+        self.cursor.execute('SELECT id, student_number, name, created_at, last_modified FROM students WHERE id=?', (student_id,))
+        return self.cursor.fetchone()
+
+    def refresh_student_row(self, student_id):
+        """평가 변경으로 바뀐 학생의 최근 수정일만 캐시와 목록에 반영"""
+        student_row = self.fetch_student_row(student_id)
+        position = bisect_left(self.student_numbers, student_row[1])
+        if position < len(self.student_numbers) and self.all_students[position][0] == student_id:
+            self.all_students[position] = student_row
+        row = self.student_model.find_row(student_id, 1, student_row[1])
+        if row >= 0:
+            self.student_model.update_row(row, student_row)
+
+    def clear_student_selection(self):
+        """선택된 학생 정보 제거 (삭제 후, 또는 불러오기/복원으로 id가 바뀌었을 때)"""
+        for attr in ('selected_student_number', 'selected_student_id'):
+            if hasattr(self, attr):
+                delattr(self, attr)
+
     def load_evaluations(self):
-        self.eval_table.setRowCount(0)
-        self.cursor.execute('SELECT id FROM students WHERE student_number=?', (self.selected_student_number,))
-        result = self.cursor.fetchone()
-        if not result:
-            return
-        student_id = result[0]
-        self.cursor.execute('SELECT subject, score, evaluation_date, notes FROM evaluations WHERE student_id=? ORDER BY evaluation_date DESC', (student_id,))
-        for row in self.cursor.fetchall():
-            row_pos = self.eval_table.rowCount()
-            self.eval_table.insertRow(row_pos)
-            for col, val in enumerate(row):
-                self.eval_table.setItem(row_pos, col, QTableWidgetItem(str(val)))
+        self.cursor.execute('SELECT id, subject, score, evaluation_date, notes FROM evaluations WHERE student_id=? ORDER BY evaluation_date DESC', (self.selected_student_id,))
+        self.eval_model.set_rows(self.cursor.fetchall())
 
     def add_evaluation(self):
         if not hasattr(self, 'selected_student_number'):
@@ -783,42 +936,38 @@ class StudentDatabase(QWidget):
             return
         try:
             score_val = float(score)
-            self.cursor.execute('SELECT id FROM students WHERE student_number=?', (self.selected_student_number,))
-            result = self.cursor.fetchone()
-            if not result:
-                return
-            student_id = result[0]
-            self.cursor.execute('INSERT INTO evaluations (student_id, subject, score, evaluation_date, notes) VALUES (?, ?, ?, ?, ?)', (student_id, subject, score_val, eval_date, notes))
-            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            self.cursor.execute('UPDATE students SET last_modified=? WHERE id=?', (now, student_id))
-            self.conn.commit()
-            self.load_evaluations()
-            self.load_students()
-            self.refresh_statistics()  # 통계 업데이트
+            student_id = self.selected_student_id
+            # 평가 추가와 트리거의 학생 최근 수정일 갱신을 한 트랜잭션으로 커밋 (오류 시 자동 롤백)
+            with self.conn:
+                self.cursor.execute('INSERT INTO evaluations (student_id, subject, score, evaluation_date, notes) VALUES (?, ?, ?, ?, ?)', (student_id, subject, score_val, eval_date, notes))
+                eval_id = self.cursor.lastrowid
+            # 전체 재조회 대신 추가된 평가 한 행과 해당 학생 행만 갱신
+            self.eval_model.insert_sorted((eval_id, subject, score_val, eval_date, notes), 3, descending=True)
+            self.adjust_eval_stats(student_id, 1, score_val)
+            self.refresh_student_row(student_id)
+            self.stats_timer.start()  # 통계 업데이트 예약
             self.subject_edit.clear()
             self.score_edit.clear()
-            self.eval_date_edit.setText(datetime.now().strftime('%Y-%m-%d'))
+            self.eval_date_edit.setText(date.today().isoformat())
             self.notes_edit.clear()
         except Exception as e:
-            self.conn.rollback()
             QMessageBox.critical(self, "오류", f"평가 추가 중 오류: {str(e)}")
 
     def delete_evaluation(self):
-        selected = self.eval_table.currentRow()
+        selected = self.eval_table.currentIndex().row()
         if selected < 0:
             QMessageBox.warning(self, "경고", "삭제할 평가를 선택해주세요.")
             return
-        subject = self.eval_table.item(selected, 0).text()
-        score = self.eval_table.item(selected, 1).text()
-        eval_date = self.eval_table.item(selected, 2).text()
-        self.cursor.execute('SELECT id FROM students WHERE student_number=?', (self.selected_student_number,))
-        student_id = self.cursor.fetchone()[0]
-        self.cursor.execute('DELETE FROM evaluations WHERE student_id=? AND subject=? AND score=? AND evaluation_date=?', (student_id, subject, score, eval_date))
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.cursor.execute('UPDATE students SET last_modified=? WHERE id=?', (now, student_id))
-        self.conn.commit()
-        self.load_evaluations()
-        self.load_students()
+        # 기본키로 정확히 한 건만 삭제 (같은 내용의 평가가 여러 건이어도 안전)
+        # 학생 최근 수정일은 트리거가 같은 트랜잭션 안에서 갱신
+        eval_id = self.eval_model.index(selected, 0).data(Qt.UserRole)
+        with self.conn:
+            self.cursor.execute('DELETE FROM evaluations WHERE id=?', (eval_id,))
+        # 전체 재조회 대신 삭제된 평가 한 행과 해당 학생 행만 갱신
+        self.adjust_eval_stats(self.selected_student_id, -1, self.eval_model.row_values(selected)[1])
+        self.eval_model.remove_row(selected)
+        self.refresh_student_row(self.selected_student_id)
+        self.stats_timer.start()  # 통계 업데이트 예약
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+ConfigManager 테스트 파일
+
+설정 파일 로드/저장과 캐시 동작을 테스트합니다.
+"""
+
+import unittest
+import tempfile
+import shutil
+import json
+import os
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_manager
+from config_manager import ConfigManager
+
+class TestConfigManager(unittest.TestCase):
+    """ConfigManager 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        # 사용자 문서 폴더 대신 임시 디렉토리 사용
+        self.temp_dir = tempfile.mkdtemp()
+        patcher = mock.patch.object(ConfigManager, 'get_student_data_dir', return_value=self.temp_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        ConfigManager._cache.clear()
+        self.config_path = os.path.join(self.temp_dir, "config.json")
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        ConfigManager._cache.clear()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_default_config_created(self):
+        """설정 파일이 없을 때 기본값 생성 테스트"""
+        manager = ConfigManager()
+        
+        self.assertTrue(os.path.exists(self.config_path))
+        self.assertEqual(manager.get('database_path'), os.path.join(self.temp_dir, "student.db"))
+        self.assertEqual(manager.get('backup_interval'), 7)
+    
+    def test_set_is_visible_to_new_instance(self):
+        """저장한 설정값이 새 인스턴스에 반영되는지 테스트"""
+        ConfigManager().set('ui_theme', 'dark')
+        
+        self.assertEqual(ConfigManager().get('ui_theme'), 'dark')
+    
+    def test_unchanged_file_uses_cache(self):
+        """수정 시각이 같으면 캐시된 설정을 사용하는지 테스트"""
+        ConfigManager()
+        stat = os.stat(self.config_path)
+        
+        # 내용만 바꾸고 수정 시각은 그대로 둠
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({"ui_theme": "dark"}, f)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        self.assertEqual(ConfigManager().get('ui_theme'), 'light')
+    
+    def test_modified_file_is_reloaded(self):
+        """파일이 외부에서 수정되면 다시 읽는지 테스트"""
+        ConfigManager()
+        stat = os.stat(self.config_path)
+        
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({"ui_theme": "dark"}, f)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        manager = ConfigManager()
+        self.assertEqual(manager.get('ui_theme'), 'dark')
+        self.assertEqual(manager.get('language'), 'ko')  # 기본값 병합
+    
+    def test_instances_do_not_share_config_dict(self):
+        """캐시된 설정을 인스턴스가 공유하지 않는지 테스트"""
+        ConfigManager()
+        first = ConfigManager()
+        second = ConfigManager()
+        
+        first.config['language'] = 'en'
+        self.assertEqual(second.get('language'), 'ko')
+
+    def test_json_fallback_matches_default_format(self):
+        """orjson이 없을 때도 같은 형식으로 저장/로드되는지 테스트"""
+        ConfigManager().set('student_name', '김철수')
+        with open(self.config_path, 'rb') as f:
+            expected = f.read()
+        os.remove(self.config_path)
+        ConfigManager._cache.clear()
+        
+        with mock.patch.object(config_manager, '_dumps', config_manager._json_dumps), \
+             mock.patch.object(config_manager, '_loads', json.loads):
+            ConfigManager().set('student_name', '김철수')
+            with open(self.config_path, 'rb') as f:
+                self.assertEqual(f.read(), expected)
+            ConfigManager._cache.clear()
+            self.assertEqual(ConfigManager().get('student_name'), '김철수')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Student Management 테스트 파일
 이 파일은 Student Management 시스템의 기본 기능을 테스트합니다.
 """
 
+import csv
 import unittest
 import tempfile
 import os
@@ -15,54 +16,44 @@ from datetime import datetime
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from database_manager import (is_valid_date, create_schema, open_database, YEAR_COUNTS_QUERY,
+                              CSV_HEADER, import_csv_file, export_csv_file,
+                              backup_database_file, restore_database_file)
+
+# (입력, 기대 결과)
+DATE_CASES = [
+    ("2024-01-20", True),
+    ("2024-12-31", True),
+    ("2024-02-29", True),     # 윤년
+    ("2023-02-29", False),    # 평년의 2월 29일
+    ("2024-13-01", False),    # 잘못된 월
+    ("2024-01-32", False),    # 잘못된 일
+    ("2024/01/20", False),    # 잘못된 형식
+    ("2024-+1-01", False),    # 숫자가 아닌 문자
+    ("2024-01-20\n", False),  # 끝의 줄바꿈
+    ("", False),              # 빈 문자열
+    (None, False),            # None
+]
+
 class TestStudentDatabase(unittest.TestCase):
     """Student Database 테스트 클래스"""
     
     def setUp(self):
         """테스트 전 설정"""
-        # 임시 데이터베이스 파일 생성
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.db_path = self.temp_db.name
-        self.temp_db.close()
-        
-        # 데이터베이스 연결
-        self.conn = sqlite3.connect(self.db_path)
+        # 애플리케이션과 같은 방식으로 메모리 데이터베이스 연결 (외래키 제약조건 포함)
+        self.conn = open_database(':memory:')
         self.cursor = self.conn.cursor()
         
-        # 외래키 제약조건 활성화
-        self.cursor.execute('PRAGMA foreign_keys = ON')
-        
         # 테이블 생성
         self.create_tables()
     
     def tearDown(self):
         """테스트 후 정리"""
         self.conn.close()
-        os.unlink(self.db_path)
     
     def create_tables(self):
-        """테스트용 테이블 생성"""
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_number TEXT UNIQUE,
-                name TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS evaluations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER,
-                subject TEXT NOT NULL,
-                score REAL,
-                evaluation_date DATE,
-                notes TEXT,
-                FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE
-            )
-        ''')
+        """테스트용 테이블 생성 (애플리케이션과 같은 스키마 사용)"""
+        create_schema(self.cursor)
         self.conn.commit()
     
     def test_add_student(self):
@@ -184,39 +175,285 @@ class TestStudentDatabase(unittest.TestCase):
         self.cursor.execute('SELECT COUNT(*) FROM evaluations WHERE student_id = ?', (student_id,))
         eval_count = self.cursor.fetchone()[0]
         self.assertEqual(eval_count, 0)
-    
+
+    def test_evaluation_query_uses_index(self):
+        """학생별 평가 조회 인덱스 사용 테스트"""
+        self.cursor.execute(
+            'EXPLAIN QUERY PLAN SELECT subject, score, evaluation_date, notes FROM evaluations WHERE student_id=? ORDER BY evaluation_date DESC',
+            (1,)
+        )
+        plan = ' '.join(row[-1] for row in self.cursor.fetchall())
+
+        # 인덱스 탐색으로 조회하고 별도 정렬을 하지 않아야 함
+        self.assertIn('idx_evals_student', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_year_query_uses_index(self):
+        """년도 목록 조회 인덱스 사용 테스트"""
+        for number in ("2024001", "2023001", "2024002", "123"):
+            self.cursor.execute(
+                'INSERT INTO students (student_number, name) VALUES (?, ?)', (number, "학생")
+            )
+        self.cursor.execute('EXPLAIN QUERY PLAN ' + YEAR_COUNTS_QUERY)
+        plan = ' '.join(row[-1] for row in self.cursor.fetchall())
+        self.assertIn('COVERING INDEX idx_students_year', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+        self.cursor.execute(YEAR_COUNTS_QUERY)
+        self.assertEqual(self.cursor.fetchall(), [("2023", 1), ("2024", 2)])
+
+    def test_evaluation_change_touches_student(self):
+        """평가 추가/삭제 시 학생 최근 수정일 갱신 테스트"""
+        old = '2000-01-01 00:00:00'
+        self.cursor.execute(
+            'INSERT INTO students (student_number, name, created_at, last_modified) VALUES (?, ?, ?, ?)',
+            ("2024005", "최민호", old, old)
+        )
+        student_id = self.cursor.lastrowid
+
+        def last_modified():
+            self.cursor.execute('SELECT last_modified FROM students WHERE id = ?', (student_id,))
+            return self.cursor.fetchone()[0]
+
+        # 평가 추가 시 갱신
+        self.cursor.execute(
+            'INSERT INTO evaluations (student_id, subject, score, evaluation_date, notes) VALUES (?, ?, ?, ?, ?)',
+            (student_id, "과학", 77.0, "2024-03-02", "")
+        )
+        eval_id = self.cursor.lastrowid
+        self.assertNotEqual(last_modified(), old)
+        datetime.strptime(last_modified(), '%Y-%m-%d %H:%M:%S')  # 기존 형식 유지
+
+        # 평가 삭제 시 갱신
+        self.cursor.execute('UPDATE students SET last_modified = ? WHERE id = ?', (old, student_id))
+        self.cursor.execute('DELETE FROM evaluations WHERE id = ?', (eval_id,))
+        self.assertNotEqual(last_modified(), old)
+        self.conn.commit()
+
+    def test_backup_and_restore(self):
+        """백업/복원 테스트"""
+        self.cursor.execute(
+            'INSERT INTO students (student_number, name) VALUES (?, ?)', ("2024006", "한지민")
+        )
+        self.conn.commit()
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        backup_path = os.path.join(temp_dir.name, 'backup.db')
+        backup_database_file(self.conn, backup_path)
+
+        # 백업 후 변경된 내용은 복원 시 사라져야 함
+        self.cursor.execute('DELETE FROM students')
+        self.conn.commit()
+        restore_database_file(self.conn, backup_path)
+
+        self.cursor.execute('SELECT student_number, name FROM students')
+        self.assertEqual(self.cursor.fetchall(), [("2024006", "한지민")])
+
+    def test_restore_old_backup_adds_schema(self):
+        """인덱스/트리거가 없는 이전 버전 백업을 복원하면 스키마 보완"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        backup_path = os.path.join(temp_dir.name, 'old_backup.db')
+        old_conn = sqlite3.connect(backup_path)
+        old_conn.executescript('''
+            CREATE TABLE students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student_number TEXT UNIQUE,
+                name TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE evaluations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student_id INTEGER,
+                subject TEXT NOT NULL,
+                score REAL,
+                evaluation_date DATE,
+                notes TEXT,
+                FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE
+            );
+            INSERT INTO students (student_number, name) VALUES ('2024007', '오세훈');
+        ''')
+        old_conn.close()
+
+        restore_database_file(self.conn, backup_path)
+
+        self.cursor.execute('SELECT student_number, name FROM students')
+        self.assertEqual(self.cursor.fetchall(), [("2024007", "오세훈")])
+        self.cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')")
+        names = {row[0] for row in self.cursor.fetchall()}
+        self.assertTrue({'idx_evals_student', 'idx_students_year',
+                         'trg_eval_insert_touch', 'trg_eval_delete_touch'} <= names)
+
+    def test_restore_backup_with_different_page_size(self):
+        """페이지 크기가 다른 백업 파일 복원 테스트 (WAL 모드 유지)"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        conn = open_database(os.path.join(temp_dir.name, 'student.db'))
+        self.addCleanup(conn.close)
+        create_schema(conn.cursor())
+        conn.commit()
+
+        backup_path = os.path.join(temp_dir.name, 'old_backup.db')
+        old_conn = sqlite3.connect(backup_path)
+        old_conn.execute('PRAGMA page_size = 1024')
+        create_schema(old_conn.cursor())
+        old_conn.execute("INSERT INTO students (student_number, name) VALUES ('2024008', '윤서연')")
+        old_conn.commit()
+        old_conn.close()
+
+        restore_database_file(conn, backup_path)
+
+        self.assertEqual(conn.execute('SELECT student_number, name FROM students').fetchall(),
+                         [("2024008", "윤서연")])
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+
     def test_date_validation(self):
         """날짜 검증 테스트"""
-        def is_valid_date(date_str):
-            if not date_str:
-                return False
-            import re
-            pattern = r'^\d{4}-\d{2}-\d{2}$'
-            if not re.match(pattern, date_str):
-                return False
-            try:
-                datetime.strptime(date_str, '%Y-%m-%d')
-                return True
-            except ValueError:
-                return False
-        
-        # 유효한 날짜
-        self.assertTrue(is_valid_date("2024-01-20"))
-        self.assertTrue(is_valid_date("2024-12-31"))
-        
-        # 무효한 날짜
-        self.assertFalse(is_valid_date("2024-13-01"))  # 잘못된 월
-        self.assertFalse(is_valid_date("2024-01-32"))  # 잘못된 일
-        self.assertFalse(is_valid_date("2024/01/20"))  # 잘못된 형식
-        self.assertFalse(is_valid_date(""))  # 빈 문자열
-        self.assertFalse(is_valid_date(None))  # None
+        for date_str, expected in DATE_CASES:
+            with self.subTest(date_str=date_str):
+                self.assertEqual(is_valid_date(date_str), expected)
+
+class TestCsvImportExport(unittest.TestCase):
+    """CSV 가져오기/내보내기 테스트 (임시 파일 데이터베이스 사용)"""
+
+    def setUp(self):
+        """테스트 전 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.conn = open_database(os.path.join(self.temp_dir.name, 'test.db'))
+        self.cursor = self.conn.cursor()
+        create_schema(self.cursor)
+        self.conn.commit()
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def write_csv(self, rows, header=None):
+        """테스트용 CSV 파일 작성 후 경로 반환"""
+        path = os.path.join(self.temp_dir.name, 'import.csv')
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(header or CSV_HEADER)
+            writer.writerows(rows)
+        return path
+
+    def fetch_students(self):
+        self.cursor.execute('SELECT student_number, name FROM students ORDER BY student_number')
+        return self.cursor.fetchall()
+
+    def fetch_evaluations(self):
+        self.cursor.execute('''
+            SELECT s.student_number, e.subject, e.score, e.evaluation_date, e.notes
+            FROM evaluations e JOIN students s ON s.id = e.student_id
+            ORDER BY s.student_number, e.evaluation_date
+        ''')
+        return self.cursor.fetchall()
+
+    def fetch_schema_names(self):
+        self.cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')")
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def test_duplicate_student_number_keeps_first_row(self):
+        """학번이 중복되면 첫 행의 학생 정보 사용"""
+        path = self.write_csv([
+            ["2024", "2024001", "김철수", "", "", "수학", "90", "2024-01-20", ""],
+            ["2024", "2024001", "김영수", "", "", "영어", "80", "2024-01-21", ""],
+        ])
+        import_csv_file(self.conn, path)
+
+        self.assertEqual(self.fetch_students(), [("2024001", "김철수")])
+        self.assertEqual(len(self.fetch_evaluations()), 2)
+
+    def test_invalid_evaluation_is_skipped(self):
+        """점수나 날짜가 잘못되면 학생만 추가하고 평가는 건너뜀"""
+        path = self.write_csv([
+            ["2024", "2024001", "김철수", "", "", "수학", "구십", "2024-01-20", ""],
+            ["2024", "2024002", "이영희", "", "", "영어", "85", "2024-02-30", ""],
+            ["2024", "2024003", "박민수", "", "", "과학", "70", "2024-03-01", "메모"],
+        ])
+        import_csv_file(self.conn, path)
+
+        self.assertEqual(self.fetch_students(),
+                         [("2024001", "김철수"), ("2024002", "이영희"), ("2024003", "박민수")])
+        self.assertEqual(self.fetch_evaluations(), [("2024003", "과학", 70.0, "2024-03-01", "메모")])
+
+    def test_bad_header_raises(self):
+        """컬럼이 다르면 ValueError 발생, 기존 데이터 유지"""
+        self.cursor.execute("INSERT INTO students (student_number, name) VALUES ('2024001', '김철수')")
+        self.conn.commit()
+        path = self.write_csv([["2024001", "이영희"]], header=["학번", "이름"])
+
+        with self.assertRaises(ValueError):
+            import_csv_file(self.conn, path)
+        self.assertEqual(self.fetch_students(), [("2024001", "김철수")])
+
+    def test_failed_import_rolls_back(self):
+        """가져오기 도중 실패하면 데이터, 인덱스, 트리거가 그대로 남아야 함"""
+        self.cursor.execute("INSERT INTO students (student_number, name) VALUES ('2024001', '김철수')")
+        self.cursor.execute(
+            "INSERT INTO evaluations (student_id, subject, score, evaluation_date) VALUES (1, '수학', 90, '2024-01-20')"
+        )
+        self.conn.commit()
+        before = self.fetch_schema_names()
+        # 이름이 빠진 행은 NOT NULL 제약조건 위반
+        path = self.write_csv([
+            ["2024", "2024002", "이영희", "", "", "", "", "", ""],
+            ["2024", "2024009"],
+        ])
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            import_csv_file(self.conn, path)
+
+        self.assertEqual(self.fetch_students(), [("2024001", "김철수")])
+        self.assertEqual(self.fetch_evaluations(), [("2024001", "수학", 90.0, "2024-01-20", None)])
+        self.assertEqual(self.fetch_schema_names(), before)
+        self.assertTrue({'idx_evals_student', 'trg_eval_insert_touch', 'trg_eval_delete_touch'} <= before)
+
+    def test_import_restores_temp_store(self):
+        """가져오기 후 연결의 원래 temp_store 설정으로 되돌리는지 테스트"""
+        self.cursor.execute('PRAGMA temp_store = DEFAULT')
+        path = self.write_csv([["2024", "2024001", "김철수", "", "", "", "", "", ""]])
+        import_csv_file(self.conn, path)
+
+        self.assertEqual(self.cursor.execute('PRAGMA temp_store').fetchone()[0], 0)
+
+    def test_export_import_round_trip(self):
+        """내보낸 CSV를 다시 가져오면 같은 데이터가 되어야 함"""
+        self.cursor.executemany(
+            'INSERT INTO students (student_number, name, created_at, last_modified) VALUES (?, ?, ?, ?)',
+            [("2024001", "김철수", "2024-01-01 09:00:00", "2024-01-20 10:00:00"),
+             ("2023001", "이영희", "2023-03-02 09:00:00", "2023-03-02 09:00:00")]
+        )
+        self.cursor.executemany(
+            'INSERT INTO evaluations (student_id, subject, score, evaluation_date, notes) VALUES (?, ?, ?, ?, ?)',
+            [(1, "수학", 90.0, "2024-01-20", "우수"), (1, "영어", 85.5, "2024-01-10", "")]
+        )
+        self.conn.commit()
+        self.cursor.execute('SELECT student_number, name, created_at, last_modified FROM students ORDER BY student_number')
+        students = self.cursor.fetchall()
+        evaluations = self.fetch_evaluations()
+
+        path = os.path.join(self.temp_dir.name, 'export.csv')
+        export_csv_file(self.conn, path)
+        import_csv_file(self.conn, path)
+
+        self.cursor.execute('SELECT student_number, name, created_at, last_modified FROM students ORDER BY student_number')
+        self.assertEqual(self.cursor.fetchall(), students)
+        self.assertEqual(self.fetch_evaluations(), evaluations)
 
 def run_tests():
     """테스트 실행"""
     print("🧪 Student Management 테스트를 시작합니다...")
     
     # 테스트 스위트 생성
-    test_suite = unittest.TestLoader().loadTestsFromTestCase(TestStudentDatabase)
+    loader = unittest.TestLoader()
+    test_suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(TestStudentDatabase),
+        loader.loadTestsFromTestCase(TestCsvImportExport),
+    ])
     
     # 테스트 실행
     runner = unittest.TextTestRunner(verbosity=2)